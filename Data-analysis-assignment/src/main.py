@@ -105,7 +105,7 @@ def run_all_analyses(csv_path: str):
         print(f"  {rank:2}. {customer_id:20} : {format_currency(sales)}")
     
     # 6. Parallel Aggregations
-    print_section("6. PARALLEL AGGREGATIONS (Using tee())")
+    print_section("6. PARALLEL AGGREGATIONS (Shared Columns)")
     parallel = analyzer.parallel_aggregations()
     print(f"  Total Sales:              {format_currency(parallel['total_sales'])}")
     print(f"  Total Profit:             {format_currency(parallel['total_profit'])}")
@@ -1,150 +1,234 @@
 """
-Superstore data analysis with pure streaming/functional operations.
+Superstore data analysis with streaming/functional operations.
 Each method demonstrates unique aggregation patterns using functional programming.
-No sorting or bulk materialization - all operations are stream-based.
+The CSV is parsed once into cached columns that every analysis reduces over.
 """
 
 import csv
-from typing import Iterator, Dict, List, Tuple, Any, Callable, Optional
-from itertools import tee, groupby
-from functools import reduce
+import threading
+from array import array
+from sys import intern
+from typing import Iterator, Dict, List, Tuple, Any, Callable, Optional, Sequence
+from itertools import compress, groupby, islice
+from functools import cached_property
 from datetime import datetime
 import heapq
+from operator import itemgetter, le
 from collections import defaultdict
 
 
+# Field names of a cleaned record, in the order clean_record() produces them.
+RECORD_FIELDS = (
+    'order_id', 'customer_id', 'product_id', 'customer_name', 'product_name',
+    'category', 'sub_category', 'segment', 'region', 'state', 'city',
+    'country', 'ship_mode', 'order_date', 'ship_date', 'sales', 'quantity',
+    'discount', 'profit',
+)
+
+# CSV header of each record field, in RECORD_FIELDS order.
+CSV_COLUMNS = (
+    'Order ID', 'Customer ID', 'Product ID', 'Customer Name', 'Product Name',
+    'Category', 'Sub-Category', 'Segment', 'Region', 'State', 'City',
+    'Country', 'Ship Mode', 'Order Date', 'Ship Date', 'Sales', 'Quantity',
+    'Discount', 'Profit',
+)
+
+# Columns a row cannot be valid without; any other absent column reads as ''.
+REQUIRED_COLUMNS = ('Order ID', 'Customer ID', 'Product ID', 'Order Date', 'Ship Date')
+
+# Read the CSV in 1 MiB chunks rather than the default 8 KiB to cut read() syscalls.
+READ_BUFFER_SIZE = 1 << 20
+
+# Float fields are cached as typed arrays (8 bytes per value instead of a
+# pointer to a boxed Python number). Kept at double precision so currency
+# totals stay exact to the cent. Quantity stays a plain list of ints, which
+# unlike an int64 array holds any value the CSV may contain.
+COLUMN_TYPECODES = {
+    'sales': 'd',
+    'discount': 'd',
+    'profit': 'd',
+}
+
+
+def _parse_date(value: str) -> datetime:
+    """Parse an M/D/YYYY date (day may be zero- or space-padded, as with strptime('%m/%d/%Y')) far faster than strptime."""
+    month, day, year = value.split('/')
+    if len(month) > 2 or len(day) > 2 or len(year) != 4:
+        raise ValueError(f"Invalid date: {value!r}")
+    if day[:1] == ' ':
+        day = day[1:]
+    if not (month + day + year).isdigit():
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime(int(year), int(month), int(day))
+
+
 class SuperstoreAnalyzer:
     
 
     def __init__(self, csv_path: str):
         self.csv_path = csv_path
+        self._load_lock = threading.Lock()
+        self._factorized: Dict[str, Tuple[Sequence[int], List[Any]]] = {}
 
     def clean_record(self, row: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Cleaning and validating a CSV row. Returns cleaned record or None if invalid."""
+        values = self._clean_values(tuple(row.get(column, '') for column in CSV_COLUMNS))
+        return None if values is None else dict(zip(RECORD_FIELDS, values))
+
+    def _clean_values(self, row: Tuple[str, ...]) -> Optional[Tuple[Any, ...]]:
+        """Positional clean_record: raw values in CSV_COLUMNS order in, RECORD_FIELDS order out."""
         try:
-            # Clean string fields (strip whitespace)
-            record = {
-                'order_id': row.get('Order ID', '').strip(),
-                'customer_id': row.get('Customer ID', '').strip(),
-                'product_id': row.get('Product ID', '').strip(),
-                'customer_name': row.get('Customer Name', '').strip(),
-                'product_name': row.get('Product Name', '').strip(),
-                'category': row.get('Category', '').strip(),
-                'sub_category': row.get('Sub-Category', '').strip(),
-                'segment': row.get('Segment', '').strip(),
-                'region': row.get('Region', '').strip(),
-                'state': row.get('State', '').strip(),
-                'city': row.get('City', '').strip(),
-                'country': row.get('Country', '').strip(),
-                'ship_mode': row.get('Ship Mode', '').strip(),
-            }
-            
-            # Parse dates
-            order_date_str = row.get('Order Date', '').strip()
-            ship_date_str = row.get('Ship Date', '').strip()
-            record['order_date'] = datetime.strptime(order_date_str, '%m/%d/%Y')
-            record['ship_date'] = datetime.strptime(ship_date_str, '%m/%d/%Y')
-            
-            # Parse numeric fields
-            record['sales'] = max(0.0, float(row.get('Sales', 0) or 0))
-            record['quantity'] = max(0, int(float(row.get('Quantity', 0) or 0)))
-            record['discount'] = max(0.0, min(1.0, float(row.get('Discount', 0) or 0)))
-            record['profit'] = float(row.get('Profit', 0) or 0)
-            
+            (order_id, customer_id, product_id, customer_name, product_name,
+             category, sub_category, segment, region, state, city, country,
+             ship_mode, order_date, ship_date, sales, quantity, discount, profit) = row
+
             # Skipping if required fields are missing
-            if not record['order_id'] or not record['customer_id'] or not record['product_id']:
+            order_id = order_id.strip()
+            customer_id = customer_id.strip()
+            product_id = product_id.strip()
+            if not order_id or not customer_id or not product_id:
                 return None
-            
-            # Validate dates
-            if record['ship_date'] < record['order_date']:
+
+            # Parse and validate dates
+            order_date = _parse_date(order_date.strip())
+            ship_date = _parse_date(ship_date.strip())
+            if ship_date < order_date:
                 return None
-            
-            return record
-        except (ValueError, KeyError, TypeError):
+
+            return (
+                order_id, customer_id, product_id,
+                # Clean string fields (strip whitespace); low-cardinality ones are
+                # interned so every row shares one key object per distinct value
+                customer_name.strip(), product_name.strip(), intern(category.strip()),
+                intern(sub_category.strip()), intern(segment.strip()), intern(region.strip()),
+                intern(state.strip()), city.strip(), intern(country.strip()),
+                intern(ship_mode.strip()),
+                order_date, ship_date,
+                # Parse numeric fields
+                max(0.0, float(sales or 0)),
+                max(0, int(float(quantity or 0))),
+                max(0.0, min(1.0, float(discount or 0))),
+                float(profit or 0),
+            )
+        except (ValueError, AttributeError, TypeError, OverflowError):
             return None
 
+    def _load_columns(self) -> Dict[str, Sequence[Any]]:
+        """Parse and clean the CSV, collecting the valid records column by column."""
+        rows: List[Tuple[Any, ...]] = []
+        # newline='' leaves line splitting (and quoted newlines) to the csv module
+        with open(self.csv_path, 'r', encoding='utf-8', errors='ignore', newline='',
+                  buffering=READ_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None:
+                # Validate the header and resolve column positions once, so each row
+                # is picked by index rather than looked up by name
+                position = {name: i for i, name in enumerate(header)}
+                missing = [column for column in REQUIRED_COLUMNS if column not in position]
+                if missing:
+                    raise ValueError(f"{self.csv_path} is missing required columns: {', '.join(missing)}")
+                # Absent optional columns are picked from a '' appended to each row (index -1)
+                pad = any(column not in position for column in CSV_COLUMNS)
+                pick = itemgetter(*[position.get(column, -1) for column in CSV_COLUMNS])
+                clean = self._clean_values
+                append = rows.append
+                for row in reader:
+                    if pad:
+                        row.append('')
+                    try:
+                        cleaned = clean(pick(row))
+                    except IndexError:
+                        continue
+                    if cleaned is not None:
+                        append(cleaned)
+        # Transpose the row tuples into columns in one C-level pass
+        transposed = zip(*rows) if rows else ((),) * len(RECORD_FIELDS)
+        columns: Dict[str, Sequence[Any]] = {}
+        for field, values in zip(RECORD_FIELDS, transposed):
+            typecode = COLUMN_TYPECODES.get(field)
+            columns[field] = array(typecode, values) if typecode else list(values)
+        return columns
+
+    @cached_property
+    def _columns(self) -> Dict[str, Sequence[Any]]:
+        """Columns of the cleaned dataset, parsed on first access and reused afterwards."""
+        # Analyses may share one analyzer across threads: make sure only one of them parses
+        with self._load_lock:
+            columns = self.__dict__.get('_columns')
+            if columns is None:
+                # Publish before releasing the lock; cached_property itself only stores
+                # the result after we return, when a waiting thread could already be inside
+                columns = self.__dict__['_columns'] = self._load_columns()
+            return columns
+
     def stream_records(self) -> Iterator[Dict[str, Any]]:
-        """Mocking a stream of records."""
-        with open(self.csv_path, 'r', encoding='utf-8', errors='ignore') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                cleaned = self.clean_record(row)
-                if cleaned is not None:
-                    yield cleaned
+        """Stream cleaned records, rebuilt from the cached columns."""
+        columns = self._columns
+        for values in zip(*columns.values()):
+            yield dict(zip(RECORD_FIELDS, values))
+
+    def _factorize(self, field: str) -> Tuple[Sequence[int], List[Any]]:
+        """Integer-code a cached column once: (codes, uniques) with uniques in first-seen order."""
+        values = self._columns[field]  # outside the lock: _columns takes it too
+        with self._load_lock:
+            factorized = self._factorized.get(field)
+            if factorized is None:
+                code_of: Dict[Any, int] = {}
+                codes = array('q', [code_of.setdefault(value, len(code_of)) for value in values])
+                factorized = self._factorized[field] = (codes, list(code_of))
+            return factorized
+
+    def _sum_by_codes(self, key_field: str, value_field: str) -> Tuple[List[float], List[Any]]:
+        """Sum a value column per distinct key, indexing a flat list by the key's integer code."""
+        codes, uniques = self._factorize(key_field)
+        totals = [0.0] * len(uniques)
+        for code, value in zip(codes, self._columns[value_field]):
+            totals[code] += value
+        return totals, uniques
 
     def total_sales(self) -> float:
-        return reduce(
-            lambda acc, record: acc + record['sales'],
-            self.stream_records(),
-            0.0
-        )
+        return sum(self._columns['sales'], 0.0)
 
     def total_profit(self) -> float:
-        return reduce(
-            lambda acc, record: acc + record['profit'],
-            self.stream_records(),
-            0.0
-        )
+        return sum(self._columns['profit'], 0.0)
 
     def aggregate_by_key(self, key_func: Callable[[Dict], str], 
                          value_func: Callable[[Dict], float]) -> Dict[str, float]:
         """Generic aggregation: group by key function and sum by value function."""
         aggregates = defaultdict(float)
         for record in self.stream_records():
-            key = key_func(record)
-            value = value_func(record)
-            aggregates[key] += value
+            aggregates[key_func(record)] += value_func(record)
         return dict(aggregates)
 
+    def aggregate_columns(self, key_field: str, value_field: str) -> Dict[str, float]:
+        """Columnar aggregation: sum one cached column grouped by another, without building records."""
+        totals, keys = self._sum_by_codes(key_field, value_field)
+        return dict(zip(keys, totals))
+
     def sales_by_category(self) -> Dict[str, float]:
         """Group sales by product category."""
-        return self.aggregate_by_key(
-            lambda r: r['category'],
-            lambda r: r['sales']
-        )
+        return self.aggregate_columns('category', 'sales')
 
     def profit_by_region(self) -> Dict[str, float]:
         """Group profit by region."""
-        return self.aggregate_by_key(
-            lambda r: r['region'],
-            lambda r: r['profit']
-        )
+        return self.aggregate_columns('region', 'profit')
 
     def sales_by_segment(self) -> Dict[str, float]:
         """Group sales by customer segment."""
-        return self.aggregate_by_key(
-            lambda r: r['segment'],
-            lambda r: r['sales']
-        )
+        return self.aggregate_columns('segment', 'sales')
 
     def streaming_statistics(self) -> Dict[str, Any]:
-        """Calculating comprehensive stats in one streaming pass."""
-        total_sales = 0.0
-        total_profit = 0.0
-        total_quantity = 0
-        record_count = 0
-        min_sale = float('inf')
-        max_sale = float('-inf')
-        min_profit = float('inf')
-        max_profit = float('-inf')
-        total_discount = 0.0
+        """Calculating comprehensive stats with one reduction per cached column."""
+        columns = self._columns
+        sales = columns['sales']
+        profit = columns['profit']
 
-        for record in self.stream_records():
-            sales = record['sales']
-            profit = record['profit']
-            quantity = record['quantity']
-            discount = record['discount']
-
-            total_sales += sales
-            total_profit += profit
-            total_quantity += quantity
-            total_discount += discount
-            record_count += 1
-
-            min_sale = min(min_sale, sales)
-            max_sale = max(max_sale, sales)
-            min_profit = min(min_profit, profit)
-            max_profit = max(max_profit, profit)
+        total_sales = sum(sales, 0.0)
+        total_profit = sum(profit, 0.0)
+        total_quantity = sum(columns['quantity'])
+        total_discount = sum(columns['discount'], 0.0)
+        record_count = len(sales)
 
         return {
             'total_sales': total_sales,
@@ -153,10 +237,10 @@ class SuperstoreAnalyzer:
             'record_count': record_count,
             'avg_sale': total_sales / record_count if record_count else 0.0,
             'avg_profit': total_profit / record_count if record_count else 0.0,
-            'min_sale': min_sale if record_count else 0.0,
-            'max_sale': max_sale if record_count else 0.0,
-            'min_profit': min_profit if record_count else 0.0,
-            'max_profit': max_profit if record_count else 0.0,
+            'min_sale': min(sales, default=0.0),
+            'max_sale': max(sales, default=0.0),
+            'min_profit': min(profit, default=0.0),
+            'max_profit': max(profit, default=0.0),
             'profit_margin': (total_profit / total_sales * 100) if total_sales else 0.0,
             'avg_discount': total_discount / record_count if record_count else 0.0
         }
@@ -168,38 +252,25 @@ class SuperstoreAnalyzer:
     def top_k_items(self, k: int, 
                    metric_func: Callable[[Dict], float],
                    label_func: Callable[[Dict], str]) -> List[Tuple[str, float]]:
-        """Avoiding sorting by using a heap."""
-        heap = []
-        for record in self.stream_records():
-            metric = metric_func(record)
-            label = label_func(record)
-            if len(heap) < k:
-                heapq.heappush(heap, (metric, label))
-            elif metric > heap[0][0]:
-                heapq.heapreplace(heap, (metric, label))
-        return sorted(heap, key=lambda x: x[0], reverse=True)
+        """Avoiding sorting by using a bounded heap (heapq.nlargest)."""
+        return heapq.nlargest(
+            k,
+            ((metric_func(record), label_func(record)) for record in self.stream_records()),
+            key=itemgetter(0)
+        )
 
     def top_products_by_sales(self, k: int = 10) -> List[Tuple[str, float]]:
-        product_sales = defaultdict(float)
-        for record in self.stream_records():
-            product_sales[record['product_name']] += record['sales']
-        
-        heap = []
-        for product, sales in product_sales.items():
-            if len(heap) < k:
-                heapq.heappush(heap, (sales, product))
-            elif sales > heap[0][0]:
-                heapq.heapreplace(heap, (sales, product))
-        return sorted(heap, key=lambda x: x[0], reverse=True)
+        totals, products = self._sum_by_codes('product_name', 'sales')
+        return heapq.nlargest(k, zip(totals, products), key=itemgetter(0))
 
     def parallel_aggregations(self) -> Dict[str, Any]:
-        stream1, stream2, stream3, stream4, stream5 = tee(self.stream_records(), 5)
-        
-        total_sales = reduce(lambda a, r: a + r['sales'], stream1, 0.0)
-        total_profit = reduce(lambda a, r: a + r['profit'], stream2, 0.0)
-        total_quantity = reduce(lambda a, r: a + r['quantity'], stream3, 0)
-        record_count = sum(1 for _ in stream4)
-        unique_customers = len(set(r['customer_id'] for r in stream5))
+        columns = self._columns
+
+        total_sales = sum(columns['sales'], 0.0)
+        total_profit = sum(columns['profit'], 0.0)
+        total_quantity = sum(columns['quantity'])
+        record_count = len(columns['sales'])
+        unique_customers = len(self._factorize('customer_id')[1])
         
         return {
             'total_sales': total_sales,
@@ -215,20 +286,59 @@ class SuperstoreAnalyzer:
                           key2_func: Callable[[Dict], str],
                           value_func: Callable[[Dict], float]) -> Dict[str, Dict[str, float]]:
         """Nested grouping: e.g., sales by region and category."""
-        nested = defaultdict(lambda: defaultdict(float))
+        aggregates = defaultdict(float)
         for record in self.stream_records():
-            key1 = key1_func(record)
-            key2 = key2_func(record)
-            value = value_func(record)
-            nested[key1][key2] += value
-        return {k1: dict(v1) for k1, v1 in nested.items()}
+            aggregates[key1_func(record), key2_func(record)] += value_func(record)
+        return self._split_pairs(aggregates)
+
+    @staticmethod
+    def _split_pairs(aggregates: Dict[Tuple[str, str], float]) -> Dict[str, Dict[str, float]]:
+        """Turn totals keyed on (key1, key2) into {key1: {key2: total}}."""
+        nested: Dict[str, Dict[str, float]] = {}
+        for (key1, key2), total in aggregates.items():
+            nested.setdefault(key1, {})[key2] = total
+        return nested
+
+    def two_level_columns(self, key1_field: str, key2_field: str,
+                          value_field: str) -> Dict[str, Dict[str, float]]:
+        """Columnar nested grouping: sum on a (key1, key2) pair, then split into nested dicts."""
+        columns = self._columns
+        keys1 = columns[key1_field]
+        keys2 = columns[key2_field]
+        values = columns[value_field]
+
+        # Fast path for data already sorted on key1: walk each run of equal keys
+        # with groupby and only hash key2 inside it
+        if all(map(le, keys1, islice(keys1, 1, None))):
+            nested: Dict[str, Dict[str, float]] = {}
+            start = 0
+            for key1, run in groupby(keys1):
+                stop = start + sum(1 for _ in run)
+                totals = defaultdict(float)
+                for key2, value in zip(keys2[start:stop], values[start:stop]):
+                    totals[key2] += value
+                nested[key1] = dict(totals)
+                start = stop
+            return nested
+
+        # Otherwise sum into one flat bucket per (key1, key2) code pair
+        codes1, uniques1 = self._factorize(key1_field)
+        codes2, uniques2 = self._factorize(key2_field)
+        width = len(uniques2)
+        buckets = [code1 * width + code2 for code1, code2 in zip(codes1, codes2)]
+        totals = [0.0] * (len(uniques1) * width)
+        for bucket, value in zip(buckets, values):
+            totals[bucket] += value
+
+        nested = {}
+        # Only pairs that actually occur, in first-seen order
+        for bucket in dict.fromkeys(buckets):
+            code1, code2 = divmod(bucket, width)
+            nested.setdefault(uniques1[code1], {})[uniques2[code2]] = totals[bucket]
+        return nested
 
     def sales_by_region_category(self) -> Dict[str, Dict[str, float]]:
-        return self.two_level_grouping(
-            lambda r: r['region'],
-            lambda r: r['category'],
-            lambda r: r['sales']
-        )
+        return self.two_level_columns('region', 'category', 'sales')
 
     def transform_stream(self, *transform_funcs: Callable[[Dict], Optional[Dict]]) -> Iterator[Dict[str, Any]]:
         for record in self.stream_records():
@@ -243,51 +353,43 @@ class SuperstoreAnalyzer:
     def conditional_aggregate(self, 
                              metric_func: Callable[[Dict], float],
                              condition_func: Callable[[Dict], bool]) -> float:
-        return reduce(
-            lambda acc, record: acc + metric_func(record),
-            filter(condition_func, self.stream_records()),
-            0.0
-        )
+        total = 0.0
+        for record in self.stream_records():
+            if condition_func(record):
+                total += metric_func(record)
+        return total
 
     def high_value_orders(self, threshold: float = 1000.0) -> int:
-        return sum(
-            1 for _ in self.filter_records(
-                lambda r: r['sales'] >= threshold
-            )
-        )
+        return sum(sale >= threshold for sale in self._columns['sales'])
 
     def profitable_orders(self) -> Dict[str, Any]:
-        profitable = list(self.filter_records(lambda r: r['profit'] > 0))
-        if not profitable:
+        profit = self._columns['profit']
+        mask = [p > 0 for p in profit]
+        count = sum(mask)
+        if not count:
             return {'count': 0, 'total_sales': 0.0, 'total_profit': 0.0}
-        
-        total_sales = sum(r['sales'] for r in profitable)
-        total_profit = sum(r['profit'] for r in profitable)
-        
+
+        total_sales = sum(compress(self._columns['sales'], mask), 0.0)
+        total_profit = sum(compress(profit, mask), 0.0)
+
         return {
-            'count': len(profitable),
+            'count': count,
             'total_sales': total_sales,
             'total_profit': total_profit,
-            'avg_profit': total_profit / len(profitable)
+            'avg_profit': total_profit / count
         }
 
     def monthly_sales_trend(self) -> Dict[str, float]:
+        # Group on an integer month index and only format the distinct months at the end
         monthly = defaultdict(float)
-        for record in self.stream_records():
-            month_key = record['order_date'].strftime('%Y-%m')
-            monthly[month_key] += record['sales']
-        return dict(sorted(monthly.items()))
+        for order_date, sales in zip(self._columns['order_date'], self._columns['sales']):
+            monthly[order_date.year * 12 + order_date.month - 1] += sales
+        return {
+            f"{month_index // 12:04d}-{month_index % 12 + 1:02d}": total
+            for month_index, total in sorted(monthly.items())
+        }
 
     def customer_lifetime_value(self, top_n: int = 10) -> List[Tuple[str, float]]:
-        customer_sales = defaultdict(float)
-        for record in self.stream_records():
-            customer_sales[record['customer_id']] += record['sales']
-        
-        heap = []
-        for customer_id, sales in customer_sales.items():
-            if len(heap) < top_n:
-                heapq.heappush(heap, (sales, customer_id))
-            elif sales > heap[0][0]:
-                heapq.heapreplace(heap, (sales, customer_id))
-        return sorted(heap, key=lambda x: x[0], reverse=True)
+        totals, customers = self._sum_by_codes('customer_id', 'sales')
+        return heapq.nlargest(top_n, zip(totals, customers), key=itemgetter(0))
 
@@ -1,8 +1,11 @@
 import csv
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 import tempfile
 import os
+import time
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -75,6 +78,13 @@ class TestSuperstoreAnalyzer(unittest.TestCase):
         self.assertAlmostEqual(result['Corporate'], 200.0, places=2)
         self.assertAlmostEqual(result['Home Office'], 150.0, places=2)
 
+    def test_aggregate_columns_matches_aggregate_by_key(self):
+        analyzer = SuperstoreAnalyzer(self.filepath)
+        self.assertEqual(
+            analyzer.aggregate_columns('region', 'sales'),
+            analyzer.aggregate_by_key(lambda r: r['region'], lambda r: r['sales'])
+        )
+
     def test_streaming_statistics(self):
         analyzer = SuperstoreAnalyzer(self.filepath)
         stats = analyzer.streaming_statistics()
@@ -129,6 +139,17 @@ class TestSuperstoreAnalyzer(unittest.TestCase):
         self.assertAlmostEqual(result['East']['Office Supplies'], 500.0, places=2)
         self.assertAlmostEqual(result['West']['Electronics'], 200.0, places=2)
 
+    def test_sales_by_region_category_sorted_input(self):
+        sorted_file = create_test_csv(sorted(self.rows, key=lambda row: row[10]))
+        try:
+            analyzer = SuperstoreAnalyzer(sorted_file)
+            self.assertEqual(
+                analyzer.sales_by_region_category(),
+                SuperstoreAnalyzer(self.filepath).sales_by_region_category()
+            )
+        finally:
+            os.unlink(sorted_file)
+
     def test_conditional_aggregate(self):
         analyzer = SuperstoreAnalyzer(self.filepath)
         result = analyzer.conditional_aggregate(
@@ -177,6 +198,92 @@ class TestSuperstoreAnalyzer(unittest.TestCase):
                       'Sales': '100', 'Quantity': '1', 'Discount': '0', 'Profit': '10'}
         self.assertIsNone(analyzer.clean_record(invalid_row))
 
+    def test_records_parsed_once(self):
+        analyzer = SuperstoreAnalyzer(self.filepath)
+        self.assertAlmostEqual(analyzer.total_sales(), 950.0, places=2)
+        with open(self.filepath, 'w') as f:
+            f.write('')
+        self.assertAlmostEqual(analyzer.total_sales(), 950.0, places=2)
+        self.assertEqual(len(list(analyzer.stream_records())), 4)
+
+    def test_infinite_quantity_dropped(self):
+        rows = self.rows + [
+            ['ORD5', '03/01/2024', '03/05/2024', 'Standard', 'C5', 'Ann', 'Consumer',
+             'USA', 'NYC', 'NY', 'East', 'P5', 'Furniture', 'Chairs', 'Chair', '10', 'inf', '0', '1']
+        ]
+        inf_file = create_test_csv(rows)
+        try:
+            analyzer = SuperstoreAnalyzer(inf_file)
+            self.assertAlmostEqual(analyzer.total_sales(), 950.0, places=2)
+            self.assertEqual(len(list(analyzer.stream_records())), 4)
+        finally:
+            os.unlink(inf_file)
+
+    def test_clean_record_date_formats(self):
+        analyzer = SuperstoreAnalyzer(self.filepath)
+        row = {'Order ID': 'ORD1', 'Customer ID': 'C1', 'Product ID': 'P1',
+               'Order Date': '6/12/2016', 'Ship Date': '06/16/2016',
+               'Sales': '100', 'Quantity': '1', 'Discount': '0', 'Profit': '10'}
+        record = analyzer.clean_record(row)
+        self.assertEqual(record['order_date'], datetime(2016, 6, 12))
+        self.assertEqual(record['ship_date'], datetime(2016, 6, 16))
+        padded = analyzer.clean_record(dict(row, **{'Order Date': '6/ 1/2016'}))
+        self.assertEqual(padded['order_date'], datetime(2016, 6, 1))
+        for bad_date in ('06/12/16', '13/01/2016', '02/30/2016', '06-12-2016'):
+            self.assertIsNone(analyzer.clean_record(dict(row, **{'Order Date': bad_date})))
+
+    def test_concurrent_analyses_parse_once(self):
+        analyzer = SuperstoreAnalyzer(self.filepath)
+        loads = []
+        load_columns = analyzer._load_columns
+
+        def counting_load():
+            loads.append(1)
+            time.sleep(0.01)  # keep the other threads queued on the lock
+            return load_columns()
+
+        analyzer._load_columns = counting_load
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(analyzer.total_sales) for _ in range(8)]
+            results = [future.result() for future in futures]
+        self.assertEqual(len(loads), 1)
+        for result in results:
+            self.assertAlmostEqual(result, 950.0, places=2)
+
+    def test_concurrent_factorize_once(self):
+        analyzer = SuperstoreAnalyzer(self.filepath)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(analyzer._factorize, ['region'] * 8))
+        for result in results:
+            self.assertIs(result, results[0])
+
+    def test_missing_columns(self):
+        fd, bad_file = tempfile.mkstemp(suffix='.csv', text=True)
+        with os.fdopen(fd, 'w', newline='') as f:
+            csv.writer(f).writerows([['Order ID', 'Sales'], ['ORD1', '100']])
+        try:
+            with self.assertRaisesRegex(ValueError, 'Customer ID'):
+                SuperstoreAnalyzer(bad_file).total_sales()
+        finally:
+            os.unlink(bad_file)
+
+    def test_missing_optional_columns(self):
+        fd, sparse_file = tempfile.mkstemp(suffix='.csv', text=True)
+        with os.fdopen(fd, 'w', newline='') as f:
+            csv.writer(f).writerows([
+                ['Order ID', 'Customer ID', 'Product ID', 'Order Date', 'Ship Date', 'Sales'],
+                ['ORD1', 'C1', 'P1', '01/01/2024', '01/05/2024', '100'],
+            ])
+        try:
+            analyzer = SuperstoreAnalyzer(sparse_file)
+            self.assertAlmostEqual(analyzer.total_sales(), 100.0, places=2)
+            record = next(analyzer.stream_records())
+            self.assertEqual(record['city'], '')
+            self.assertEqual(record['quantity'], 0)
+            self.assertEqual(record['profit'], 0.0)
+        finally:
+            os.unlink(sparse_file)
+
     def test_empty_file(self):
         empty_file = create_test_csv([])
         try:
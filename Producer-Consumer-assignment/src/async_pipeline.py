@@ -0,0 +1,47 @@
+"""
+Single-threaded asyncio variant of the producer/consumer pipeline.
+Producer and consumer are coroutines sharing an asyncio.Queue on one event loop,
+so hand-offs need no OS threads, lock contention or GIL switches.
+Shutdown uses a None sentinel, since asyncio.Queue has no close()/shutdown() before Python 3.13.
+"""
+
+import asyncio
+from typing import Any, List
+
+
+async def produce(queue: asyncio.Queue, source: List[Any]) -> None:
+    """Enqueue every source item, then the sentinel."""
+    for item in source:
+        # Suspends (instead of blocking a thread) while the queue is full
+        await queue.put(item)
+    await queue.put(None)  # sentinel value to signal consumer to stop
+
+
+async def consume(queue: asyncio.Queue, destination: List[Any]) -> None:
+    """Dequeue items into the destination until the sentinel arrives."""
+    while True:
+        # Suspends while the queue is empty
+        item = await queue.get()
+        if item is None:
+            break
+        destination.append(item)
+
+
+async def run_pipeline(source: List[Any], destination: List[Any], maxSize: int = 4) -> None:
+    """Run one producer and one consumer over a bounded queue until the source is drained."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxSize)
+    await asyncio.gather(produce(queue, source), consume(queue, destination))
+
+
+def main():
+    """ Same demo as src.main, on a single event loop instead of two threads """
+    source_data = list(range(1, 11))
+    destination_data: List[int] = []
+
+    asyncio.run(run_pipeline(source_data, destination_data))
+
+    print("Final destination data:", destination_data)
+
+
+if __name__ == "__main__":
+    main()
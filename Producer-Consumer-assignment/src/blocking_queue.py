@@ -1,6 +1,14 @@
 import threading
-import time
-from typing import Any, List
+from collections import deque
+from queue import Empty, SimpleQueue
+from typing import Any, Deque, List, Optional, Sequence, Union
+
+# Above this capacity a bound is effectively never hit, so make_queue() hands out the unbounded C queue.
+UNBOUNDED_THRESHOLD = 10_000
+
+
+class QueueClosed(Exception):
+    """Raised by get() once a closed queue is drained, and by put() on a closed queue."""
 
 
 class BlockingQueue:
@@ -8,33 +16,185 @@ class BlockingQueue:
     Bounded blocking queue.
     Lock + Condition + wait()/notify() for synchronization.
     We keep two conditions so that we can have two waiting queues for producer and consumer each.
+    Both share one plain (C-implemented) Lock and are signalled with notify(), never notify_all(),
+    so each put/get wakes at most one waiter on the opposite side (close() is the one broadcast).
+    Shutdown is out of band: the producer calls close() instead of enqueueing a sentinel.
     """
 
     def __init__(self, maxSize: int):
         self.maxSize = maxSize
-        self.queue: List[Any] = []
+        self.queue: Deque[Any] = deque()
         self.lock = threading.Lock()
         self.notEmpty = threading.Condition(self.lock)
         self.notFull = threading.Condition(self.lock)
+        # Threads currently blocked in wait() on each condition; notify() is skipped when nobody waits
+        self._emptyWaiters = 0
+        self._fullWaiters = 0
+        self._closed = False
+
+    @classmethod
+    def auto(cls, num_consumers: int = 1) -> "BlockingQueue":
+        """
+        Queue sized at two slots per consumer (at least 2).
+        That keeps every consumer fed while the producer refills, yet stays bounded:
+        a producer that outpaces its consumers blocks instead of growing memory without limit.
+        """
+        return cls(maxSize=max(2, 2 * num_consumers))
+
+    def _waitNotFull(self) -> None:
+        """Wait (lock held) until a consumer frees space, counted as a blocked producer."""
+        self._fullWaiters += 1
+        try:
+            self.notFull.wait()
+        finally:
+            self._fullWaiters -= 1
+
+    def _waitNotEmpty(self) -> None:
+        """Wait (lock held) until a producer adds an item, counted as a blocked consumer."""
+        self._emptyWaiters += 1
+        try:
+            self.notEmpty.wait()
+        finally:
+            self._emptyWaiters -= 1
+
+    def close(self) -> None:
+        """Stop accepting items and wake every waiter; consumers finish the backlog, then get QueueClosed."""
+        with self.lock:
+            self._closed = True
+            self.notEmpty.notify_all()
+            self.notFull.notify_all()
 
     def put(self, item: Any) -> None:
         """Put an item into the queue, blocking if the queue is full."""
         with self.notFull:
-            while len(self.queue) >= self.maxSize:
+            while len(self.queue) >= self.maxSize and not self._closed:
                 # Wait until a consumer removes an item
-                self.notFull.wait()
+                self._waitNotFull()
+            if self._closed:
+                raise QueueClosed
             self.queue.append(item)
             # Signal that the queue is no longer empty
-            self.notEmpty.notify()
+            if self._emptyWaiters:
+                self.notEmpty.notify()
 
     def get(self) -> Any:
-        """Remove and return an item from the queue, blocking if empty."""
+        """Remove and return an item from the queue, blocking if empty. Raises QueueClosed once closed and drained."""
         with self.notEmpty:
-            while len(self.queue) == 0:
+            while not self.queue:
+                if self._closed:
+                    raise QueueClosed
                 # Wait until a producer adds an item
-                self.notEmpty.wait()
-            item = self.queue.pop(0)
+                self._waitNotEmpty()
+            item = self.queue.popleft()
             # Signal that there is now space for producers
-            self.notFull.notify()
+            if self._fullWaiters:
+                self.notFull.notify()
             return item
 
+    def put_many(self, items: Sequence[Any]) -> None:
+        """Put a batch of items, moving as many as fit per lock acquisition and blocking while full."""
+        start = 0
+        with self.notFull:
+            while start < len(items):
+                while len(self.queue) >= self.maxSize and not self._closed:
+                    # Wait until a consumer frees some space
+                    self._waitNotFull()
+                if self._closed:
+                    raise QueueClosed
+                batch = items[start:start + self.maxSize - len(self.queue)]
+                self.queue.extend(batch)
+                start += len(batch)
+                # Wake one consumer per item just added
+                if self._emptyWaiters:
+                    self.notEmpty.notify(len(batch))
+
+    def get_many(self, maxItems: int) -> List[Any]:
+        """Remove and return up to maxItems items (at least one), blocking if empty. Raises QueueClosed once closed and drained."""
+        with self.notEmpty:
+            while not self.queue:
+                if self._closed:
+                    raise QueueClosed
+                # Wait until a producer adds an item
+                self._waitNotEmpty()
+            if maxItems >= len(self.queue):
+                # Taking everything: swap in a fresh buffer (ping-pong) instead of popping item by item
+                drained, self.queue = self.queue, deque()
+                items = list(drained)
+            else:
+                items = [self.queue.popleft() for _ in range(maxItems)]
+            count = len(items)
+            # Wake one producer per slot just freed
+            if self._fullWaiters:
+                self.notFull.notify(count)
+            return items
+
+
+class UnboundedQueue:
+    """
+    Unbounded queue backed by CPython's C-implemented queue.SimpleQueue.
+    Same put/get/put_many/get_many/close interface as BlockingQueue, but put never blocks.
+    close() enqueues a private marker behind the backlog; whoever reaches it puts it back and raises QueueClosed.
+    Puts and close() share a small lock so no item can land behind the marker; gets need no lock.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self):
+        self.queue: SimpleQueue = SimpleQueue()
+        self.lock = threading.Lock()
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop accepting items; consumers finish the backlog, then get QueueClosed."""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.queue.put(self._CLOSED)
+
+    def put(self, item: Any) -> None:
+        """Put an item into the queue (never blocks)."""
+        with self.lock:
+            if self._closed:
+                raise QueueClosed
+            self.queue.put(item)
+
+    def get(self) -> Any:
+        """Remove and return an item from the queue, blocking if empty. Raises QueueClosed once closed and drained."""
+        item = self.queue.get()
+        if item is self._CLOSED:
+            # Leave the marker for any other consumer
+            self.queue.put(item)
+            raise QueueClosed
+        return item
+
+    def put_many(self, items: Sequence[Any]) -> None:
+        """Put a batch of items (never blocks)."""
+        with self.lock:
+            if self._closed:
+                raise QueueClosed
+            put = self.queue.put
+            for item in items:
+                put(item)
+
+    def get_many(self, maxItems: int) -> List[Any]:
+        """Remove and return up to maxItems items (at least one), blocking if empty. Raises QueueClosed once closed and drained."""
+        items = [self.get()]
+        try:
+            while len(items) < maxItems:
+                item = self.queue.get_nowait()
+                if item is self._CLOSED:
+                    # Return what we have; the next call sees the marker and raises
+                    self.queue.put(item)
+                    break
+                items.append(item)
+        except Empty:
+            pass
+        return items
+
+
+def make_queue(maxSize: Optional[int] = None) -> Union[BlockingQueue, UnboundedQueue]:
+    """Bounded BlockingQueue for real capacities; the C-backed UnboundedQueue when maxSize is None or huge."""
+    if maxSize is None or maxSize > UNBOUNDED_THRESHOLD:
+        return UnboundedQueue()
+    return BlockingQueue(maxSize)
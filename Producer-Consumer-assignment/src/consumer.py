@@ -1,27 +1,63 @@
 import threading
-import time
-from typing import List, Any
-from .blocking_queue import BlockingQueue
+from typing import Any, Callable, List, Optional
+from .blocking_queue import BlockingQueue, QueueClosed
+
+
+def consume(queue: BlockingQueue, destination: List[Any],
+            work_fn: Optional[Callable[[Any], None]] = None,
+            batch_size: int = 64, verbose: bool = False,
+            expected_size: Optional[int] = None) -> None:
+    """Consumer body: dequeue items in batches into destination until the queue is closed and drained."""
+    idx = len(destination)  # next write position in destination
+    if expected_size is not None:
+        destination.extend([None] * expected_size)
+    # Resolve the bound method and the per-item flag once, outside the loop
+    get_many = queue.get_many
+    per_item = work_fn is not None or verbose
+    try:
+        while True:
+            try:
+                # Drain whatever is available (up to batch_size) under a single lock acquisition
+                batch = get_many(batch_size)
+            except QueueClosed:
+                # Producer closed the queue and everything has been drained
+                if verbose:
+                    print("(Consumer) Queue closed, stopping.")
+                return
+            if per_item:
+                for item in batch:
+                    if verbose:
+                        print(f"(Consumer) Consuming: {item}")
+                    if work_fn is not None:
+                        work_fn(item)
+            # Write the batch at the current position with one slice assignment
+            destination[idx:idx + len(batch)] = batch
+            idx += len(batch)
+    except BaseException:
+        # Close the queue so a producer blocked on a full queue gets QueueClosed instead of waiting forever
+        queue.close()
+        raise
+    finally:
+        if expected_size is not None:
+            # Drop unused pre-sized slots if fewer items than expected arrived
+            del destination[idx:]
+
 
 class Consumer(threading.Thread):
     """Consumer thread: dequeues items and writes them to a destination container."""
 
-    def __init__(self, queue: BlockingQueue, destination: List[Any], delay: float = 0.15):
+    def __init__(self, queue: BlockingQueue, destination: List[Any],
+                 work_fn: Optional[Callable[[Any], None]] = None,
+                 batch_size: int = 64, verbose: bool = False,
+                 expected_size: Optional[int] = None):
         super().__init__()
         self.queue = queue
         self.destination = destination
-        self.delay = delay
+        self.work_fn = work_fn  # optional per-item work (see simulation.sleep_simulator)
+        self.batch_size = batch_size
+        self.verbose = verbose  # per-item logging; off by default to keep print() off the hot path
+        self.expected_size = expected_size  # if known, destination is pre-sized once instead of growing
 
     def run(self) -> None:
-        while True:
-            item = self.queue.get()
-            if item is None:
-                # TODO: Put sentinel back if we  have multiple consumers
-                # self.queue.put(None)
-                print("(Consumer) Received sentinel, stopping.")
-                break
-            # Simulatuing processing work
-            print(f"(Consumer) Consuming: {item}")
-            time.sleep(self.delay)
-            self.destination.append(item)
-
+        consume(self.queue, self.destination, self.work_fn, self.batch_size,
+                self.verbose, self.expected_size)
@@ -1,28 +1,30 @@
-from typing import List
-from .blocking_queue import BlockingQueue
-from .producer import Producer
-from .consumer import Consumer
+import argparse
+from typing import List, Optional, Sequence
+from .pipeline import run_fused, run_pipeline
+from .simulation import sleep_simulator
+
+def main(argv: Optional[Sequence[str]] = None):
+    """ Move source to destination on the producer/consumer workers, or fused in this thread when there is no per-item work """
+    parser = argparse.ArgumentParser(description="Producer-consumer pipeline demo")
+    parser.add_argument("--delay", type=float, default=0.0001,
+                        help="simulated per-item work in seconds on each side; 0 runs fused in this thread")
+    args = parser.parse_args(argv)
 
-def main():
-    """ Initialize all objects and start the threads for producer and consumer and join them """
     # Example source and destination containers
     source_data = list(range(1, 11))  # e.g., items 1..10
     destination_data: List[int] = []
 
-    # Shared blocking queue
-    bq = BlockingQueue(maxSize=4)
-
-    # Create producer and consumer threads
-    producer = Producer(queue=bq, source=source_data, delay=0.0001)
-    consumer = Consumer(queue=bq, destination=destination_data, delay=0.0001)
-
-    # Start threads
-    producer.start()
-    consumer.start()
-
-    # Wait for both to finish
-    producer.join()
-    consumer.join()
+    if args.delay <= 0:
+        # Nothing to overlap: two threads and a queue would only add overhead
+        run_fused(source_data, destination_data)
+    else:
+        # Producer and consumer share a BlockingQueue.auto(1) (two slots for the one consumer)
+        producer, consumer = run_pipeline(source_data, destination_data,
+                                          work_fn=sleep_simulator(args.delay), verbose=True)
+
+        # Wait for both to finish (re-raises any error from either side)
+        producer.result()
+        consumer.result()
 
     print("Final destination data:", destination_data)
 
@@ -0,0 +1,51 @@
+"""
+Pipeline runner on a shared, lazily created thread pool.
+Repeated runs reuse the same two worker threads instead of starting fresh Producer/Consumer threads.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+from .blocking_queue import BlockingQueue
+from .consumer import consume
+from .producer import produce
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executorLock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline")
+    return _executor
+
+
+def run_pipeline(source: List[Any], destination: List[Any], maxSize: Optional[int] = None,
+                 work_fn: Optional[Callable[[Any], None]] = None,
+                 verbose: bool = False) -> Tuple[Future, Future]:
+    """Start one producer and one consumer over a fresh BlockingQueue; returns their (producer, consumer) futures."""
+    # Without an explicit size, bound the queue for its single consumer
+    queue = BlockingQueue(maxSize) if maxSize is not None else BlockingQueue.auto(1)
+    # Submit each pair back to back so the two workers always run matching halves of one pipeline
+    with _executorLock:
+        executor = _get_executor()
+        producer = executor.submit(produce, queue, source, work_fn, verbose=verbose)
+        consumer = executor.submit(consume, queue, destination, work_fn, verbose=verbose)
+    return producer, consumer
+
+
+def run_fused(source: List[Any], destination: List[Any],
+              work_fn: Optional[Callable[[Any], None]] = None) -> None:
+    """Single-threaded equivalent of run_pipeline for when there is nothing to overlap.
+
+    Without work_fn the queue is a pure pass-through, so this is one list.extend;
+    with it, each item gets the producer's and then the consumer's work_fn call.
+    """
+    if work_fn is None:
+        destination.extend(source)
+        return
+    for item in source:
+        work_fn(item)
+        work_fn(item)
+        destination.append(item)
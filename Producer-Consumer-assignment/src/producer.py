@@ -1,23 +1,61 @@
 import threading
-import time
-from typing import List, Any
+from array import array
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional
 from .blocking_queue import BlockingQueue
 
+# Source types whose slices are cheap C-level copies; other sequences (e.g. deque) cannot be sliced
+SLICEABLE_TYPES = (list, tuple, range, str, bytes, bytearray, memoryview, array)
+
+
+def produce(queue: BlockingQueue, source: Iterable[Any],
+            work_fn: Optional[Callable[[Any], None]] = None,
+            batch_size: int = 64, verbose: bool = False) -> None:
+    """Producer body: read items from source, enqueue them, then close the queue."""
+    try:
+        if work_fn is not None or verbose:
+            # Per-item work: hand each item over as soon as it is ready, so the consumer
+            # works on it while the producer moves on to the next one
+            put = queue.put
+            for item in source:
+                if work_fn is not None:
+                    work_fn(item)
+                if verbose:
+                    print(f"(Producer) Producing: {item}")
+                put(item)
+        else:
+            # Pure hand-off: move items in batches so the queue's lock/condition is taken once per batch.
+            # Sliceable sources (SLICEABLE_TYPES) are cut with one C-level slice per batch;
+            # other iterables are chunked item by item.
+            if isinstance(source, SLICEABLE_TYPES):
+                batches = (source[start:start + batch_size] for start in range(0, len(source), batch_size))
+            else:
+                items = iter(source)
+                batches = iter(lambda: list(islice(items, batch_size)), [])
+            # Resolve the bound method once, outside the loop
+            put_many = queue.put_many
+            for batch in batches:
+                put_many(batch)
+    finally:
+        # Close the queue even on error, so the consumer drains what arrived and stops
+        # instead of blocking forever on a producer that is gone
+        if verbose:
+            print("(Producer) Closing queue, done.")
+        queue.close()
+
+
 class Producer(threading.Thread):
     """Producer thread: reads from a source container and enqueues items."""
 
-    def __init__(self, queue: BlockingQueue, source: List[Any], delay: float = 0.1):
+    def __init__(self, queue: BlockingQueue, source: Iterable[Any],
+                 work_fn: Optional[Callable[[Any], None]] = None,
+                 batch_size: int = 64, verbose: bool = False):
         super().__init__()
         self.queue = queue
         self.source = source
-        self.delay = delay
+        self.work_fn = work_fn  # optional per-item work (see simulation.sleep_simulator)
+        self.batch_size = batch_size
+        self.verbose = verbose  # per-item logging; off by default to keep print() off the hot path
 
     def run(self) -> None:
-        for item in self.source:
-            # Simulating item production
-            time.sleep(self.delay)
-            print(f"(Producer) Producing: {item}")
-            self.queue.put(item)
-        # Send sentinel to signal consumer to stop
-        print("(Producer) Sending sentinel, done.")
-        self.queue.put(None)  # sentinel value to signal consumer to stop
+        produce(self.queue, self.source, self.work_fn, self.batch_size, self.verbose)
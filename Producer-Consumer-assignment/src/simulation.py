@@ -0,0 +1,9 @@
+import time
+from typing import Any, Callable
+
+
+def sleep_simulator(delay: float) -> Callable[[Any], None]:
+    """Work function for Producer/Consumer that simulates processing by sleeping `delay` seconds per item."""
+    def work(item: Any) -> None:
+        time.sleep(delay)
+    return work
@@ -0,0 +1,26 @@
+import asyncio
+import unittest
+from src.async_pipeline import consume, produce, run_pipeline
+
+class TestAsyncPipeline(unittest.TestCase):
+    def test_full_workflow(self):
+        """Verify data integrity from source to destination on one event loop."""
+        source = list(range(1000))
+        destination = []
+
+        asyncio.run(run_pipeline(source, destination, maxSize=10))
+
+        self.assertEqual(source, destination)
+
+    def test_sentinel_ordering(self):
+        """Producer enqueues all items followed by the sentinel; consumer stops on it."""
+        async def scenario():
+            queue = asyncio.Queue(maxsize=5)
+            await produce(queue, [1, 2, 3])
+            self.assertEqual(queue.qsize(), 4)
+
+            destination = []
+            await consume(queue, destination)
+            return destination
+
+        self.assertEqual(asyncio.run(scenario()), [1, 2, 3])
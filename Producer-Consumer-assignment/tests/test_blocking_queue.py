@@ -1,7 +1,7 @@
 import unittest
 import threading
 import time
-from src.blocking_queue import BlockingQueue
+from src.blocking_queue import BlockingQueue, QueueClosed, UnboundedQueue, make_queue
 
 class TestBlockingQueue(unittest.TestCase):
     def setUp(self):
@@ -52,4 +52,122 @@ class TestBlockingQueue(unittest.TestCase):
         # Unblock by removing an item
         self.bq.get()
         t.join(timeout=1.0)
-        self.assertFalse(t.is_alive(), "Thread should finish after space is made")
\ No newline at end of file
+        self.assertFalse(t.is_alive(), "Thread should finish after space is made")
+
+    def test_put_many_get_many(self):
+        """Batches keep FIFO order and get_many returns at most what is asked for."""
+        self.bq.put_many([1, 2, 3])
+        self.assertEqual(self.bq.get_many(2), [1, 2])
+        self.assertEqual(self.bq.get_many(10), [3])
+
+    def test_put_many_blocks_until_batch_fits(self):
+        """put_many() fills the free space, then blocks until the rest of the batch fits."""
+        def producer_thread():
+            self.bq.put_many([1, 2, 3, 4, 5])
+
+        t = threading.Thread(target=producer_thread)
+        t.start()
+
+        time.sleep(0.05)
+        self.assertTrue(t.is_alive(), "Thread should be blocked with part of its batch pending")
+
+        self.assertEqual(self.bq.get_many(3), [1, 2, 3])
+        t.join(timeout=1.0)
+        self.assertFalse(t.is_alive(), "Thread should finish once the batch fits")
+        self.assertEqual(self.bq.get_many(3), [4, 5])
+
+    def test_close_drains_then_raises(self):
+        """Items queued before close() are still delivered; afterwards get() and put() raise."""
+        self.bq.put(1)
+        self.bq.close()
+        self.assertEqual(self.bq.get(), 1)
+        with self.assertRaises(QueueClosed):
+            self.bq.get()
+        with self.assertRaises(QueueClosed):
+            self.bq.put(2)
+
+    def test_close_wakes_blocked_consumer(self):
+        """A consumer blocked on an empty queue is released by close()."""
+        raised = []
+
+        def consumer_thread():
+            try:
+                self.bq.get()
+            except QueueClosed:
+                raised.append(True)
+
+        t = threading.Thread(target=consumer_thread)
+        t.start()
+
+        time.sleep(0.05)
+        self.assertTrue(t.is_alive(), "Thread should be blocked on empty queue")
+
+        self.bq.close()
+        t.join(timeout=1.0)
+        self.assertFalse(t.is_alive(), "Thread should finish after close")
+        self.assertEqual(raised, [True])
+
+    def test_auto_size(self):
+        """auto() allows two slots per consumer, never fewer than two."""
+        self.assertEqual(BlockingQueue.auto(1).maxSize, 2)
+        self.assertEqual(BlockingQueue.auto(3).maxSize, 6)
+        self.assertEqual(BlockingQueue.auto(0).maxSize, 2)
+
+
+class TestMakeQueue(unittest.TestCase):
+    def test_bounded_sizes_use_blocking_queue(self):
+        bq = make_queue(10)
+        self.assertIsInstance(bq, BlockingQueue)
+        self.assertEqual(bq.maxSize, 10)
+
+    def test_unbounded_sizes_use_simple_queue(self):
+        self.assertIsInstance(make_queue(), UnboundedQueue)
+        self.assertIsInstance(make_queue(1_000_000), UnboundedQueue)
+
+    def test_unbounded_put_get(self):
+        """UnboundedQueue keeps FIFO order across single and batched operations."""
+        uq = make_queue()
+        uq.put(1)
+        uq.put_many([2, 3, 4])
+        self.assertEqual(uq.get(), 1)
+        self.assertEqual(uq.get_many(2), [2, 3])
+        self.assertEqual(uq.get_many(10), [4])
+
+    def test_unbounded_close(self):
+        uq = make_queue()
+        uq.put_many([1, 2])
+        uq.close()
+        self.assertEqual(uq.get_many(10), [1, 2])
+        with self.assertRaises(QueueClosed):
+            uq.get_many(10)
+        with self.assertRaises(QueueClosed):
+            uq.put(3)
+
+    def test_unbounded_close_races_put(self):
+        """Every put that succeeds before a concurrent close() is still delivered."""
+        uq = make_queue()
+        accepted = []
+
+        def putter():
+            n = 0
+            while True:
+                try:
+                    uq.put(n)
+                except QueueClosed:
+                    return
+                accepted.append(n)
+                n += 1
+
+        threads = [threading.Thread(target=putter) for _ in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.01)
+        uq.close()
+        for t in threads:
+            t.join(timeout=2.0)
+
+        received = []
+        with self.assertRaises(QueueClosed):
+            while True:
+                received.extend(uq.get_many(1000))
+        self.assertEqual(sorted(received), sorted(accepted))
@@ -1,19 +1,20 @@
 import unittest
-from src.consumer import Consumer
-from src.blocking_queue import BlockingQueue
+import threading
+from src.consumer import Consumer, consume
+from src.blocking_queue import BlockingQueue, QueueClosed
 
 class TestConsumer(unittest.TestCase):
     def setUp(self):
         self.bq = BlockingQueue(maxSize=5)
         self.destination = []
-        self.consumer = Consumer(self.bq, self.destination, delay=0.0)
+        self.consumer = Consumer(self.bq, self.destination)
 
     def test_consumer_consumption(self):
-        """Test that consumer drains queue until sentinel."""
+        """Test that consumer drains queue until it is closed."""
         # Pre-fill queue
         self.bq.put(10)
         self.bq.put(20)
-        self.bq.put(None) # Sentinel
+        self.bq.close()
 
         self.consumer.start()
         self.consumer.join(timeout=2.0)
@@ -21,9 +22,45 @@ class TestConsumer(unittest.TestCase):
         self.assertFalse(self.consumer.is_alive())
         self.assertEqual(self.destination, [10, 20])
 
-    def test_immediate_sentinel(self):
+    def test_immediate_close(self):
         """Test consumer receiving immediate stop signal."""
-        self.bq.put(None)
+        self.bq.close()
         self.consumer.start()
         self.consumer.join(timeout=1.0)
-        self.assertEqual(self.destination, [])
\ No newline at end of file
+        self.assertEqual(self.destination, [])
+
+    def test_expected_size(self):
+        """Pre-sized destination ends up exactly as long as what was consumed."""
+        destination = ['existing']
+        consumer = Consumer(self.bq, destination, expected_size=5)
+        self.bq.put_many([10, 20, 30])
+        self.bq.close()
+
+        consumer.start()
+        consumer.join(timeout=1.0)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(destination, ['existing', 10, 20, 30])
+
+    def test_error_closes_queue(self):
+        """A failing consumer closes the queue so a producer blocked on it is released."""
+        def fail(item):
+            raise ValueError(item)
+
+        self.bq.put_many([1, 2, 3, 4, 5])
+        errors = []
+
+        def blocked_put():
+            try:
+                self.bq.put(6)
+            except QueueClosed as exc:
+                errors.append(exc)
+
+        putter = threading.Thread(target=blocked_put)
+        putter.start()
+        with self.assertRaises(ValueError):
+            consume(self.bq, self.destination, work_fn=fail)
+        putter.join(timeout=1.0)
+
+        self.assertFalse(putter.is_alive())
+        self.assertEqual(len(errors), 1)
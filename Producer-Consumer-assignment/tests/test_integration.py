@@ -1,7 +1,9 @@
 import unittest
+from array import array
 from src.producer import Producer
 from src.consumer import Consumer
-from src.blocking_queue import BlockingQueue
+from src.blocking_queue import BlockingQueue, make_queue
+from src.simulation import sleep_simulator
 
 class TestIntegration(unittest.TestCase):
     def test_full_workflow(self):
@@ -10,8 +12,8 @@ class TestIntegration(unittest.TestCase):
         destination = []
         bq = BlockingQueue(maxSize=4) # Small queue to force context switching
 
-        p = Producer(bq, source, delay=0.001)
-        c = Consumer(bq, destination, delay=0.001)
+        p = Producer(bq, source, work_fn=sleep_simulator(0.001))
+        c = Consumer(bq, destination, work_fn=sleep_simulator(0.001))
 
         p.start()
         c.start()
@@ -31,8 +33,8 @@ class TestIntegration(unittest.TestCase):
         destination = []
         bq = BlockingQueue(maxSize=10)
 
-        p = Producer(bq, source, delay=0.0)
-        c = Consumer(bq, destination, delay=0.0)
+        p = Producer(bq, source)
+        c = Consumer(bq, destination, expected_size=len(source))
 
         p.start()
         c.start()
@@ -41,4 +43,38 @@ class TestIntegration(unittest.TestCase):
         c.join(timeout=5.0)
 
         self.assertEqual(len(destination), 1000)
-        self.assertEqual(source, destination)
\ No newline at end of file
+        self.assertEqual(source, destination)
+
+    def test_unbounded_queue_workflow(self):
+        """Producer/Consumer work unchanged on top of the SimpleQueue-backed queue."""
+        source = list(range(1000))
+        destination = []
+        uq = make_queue()
+
+        p = Producer(uq, source)
+        c = Consumer(uq, destination)
+
+        p.start()
+        c.start()
+
+        p.join(timeout=5.0)
+        c.join(timeout=5.0)
+
+        self.assertEqual(source, destination)
+
+    def test_buffer_source(self):
+        """Sliceable non-list sources are handed over in slices and arrive intact."""
+        source = array('q', range(1000))
+        destination = []
+        bq = BlockingQueue(maxSize=10)
+
+        p = Producer(bq, source)
+        c = Consumer(bq, destination)
+
+        p.start()
+        c.start()
+
+        p.join(timeout=5.0)
+        c.join(timeout=5.0)
+
+        self.assertEqual(list(source), destination)
@@ -0,0 +1,57 @@
+import unittest
+from src.pipeline import run_fused, run_pipeline
+
+class TestPipeline(unittest.TestCase):
+    def test_run_pipeline(self):
+        """Verify data integrity through the shared-executor pipeline."""
+        source = list(range(1000))
+        destination = []
+
+        producer, consumer = run_pipeline(source, destination, maxSize=10)
+        producer.result(timeout=5.0)
+        consumer.result(timeout=5.0)
+
+        self.assertEqual(source, destination)
+
+    def test_repeated_runs_reuse_workers(self):
+        """Back-to-back pipelines all complete on the same pool."""
+        runs = []
+        for n in range(5):
+            source = list(range(n * 10))
+            destination = []
+            runs.append((source, destination, run_pipeline(source, destination, maxSize=2)))
+
+        for source, destination, (producer, consumer) in runs:
+            producer.result(timeout=5.0)
+            consumer.result(timeout=5.0)
+            self.assertEqual(source, destination)
+
+    def test_run_fused(self):
+        """Fused run copies the source and applies work_fn once per side."""
+        destination = [0]
+        run_fused([1, 2, 3], destination)
+        self.assertEqual(destination, [0, 1, 2, 3])
+
+        seen = []
+        destination = []
+        run_fused([1, 2], destination, work_fn=seen.append)
+        self.assertEqual(destination, [1, 2])
+        self.assertEqual(seen, [1, 1, 2, 2])
+
+    def test_failing_work_fn_releases_workers(self):
+        """A work_fn error fails the pipeline without leaving a pool worker blocked."""
+        def fail_on_five(item):
+            if item == 5:
+                raise ValueError(item)
+
+        producer, consumer = run_pipeline(list(range(100)), [], maxSize=2, work_fn=fail_on_five)
+        with self.assertRaises(ValueError):
+            producer.result(timeout=5.0)
+        consumer.result(timeout=5.0)
+
+        # The shared pool still has both workers free for the next run
+        destination = []
+        producer, consumer = run_pipeline([1, 2, 3], destination)
+        producer.result(timeout=5.0)
+        consumer.result(timeout=5.0)
+        self.assertEqual(destination, [1, 2, 3])
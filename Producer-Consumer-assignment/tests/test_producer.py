@@ -1,7 +1,8 @@
 import unittest
 import threading
+from collections import deque
 from src.producer import Producer
-from src.blocking_queue import BlockingQueue
+from src.blocking_queue import BlockingQueue, QueueClosed
 
 class TestProducer(unittest.TestCase):
     def setUp(self):
@@ -9,9 +10,9 @@ class TestProducer(unittest.TestCase):
         self.source = [1, 2, 3]
 
     def test_producer_lifecycle(self):
-        """Test that producer moves all items + sentinel to queue."""
-        # Setting delay to 0 for fast testing
-        producer = Producer(self.bq, self.source, delay=0.0)
+        """Test that producer moves all items to the queue, then closes it."""
+        # No work_fn, so nothing slows the producer down
+        producer = Producer(self.bq, self.source)
         producer.start()
         producer.join(timeout=2.0)
 
@@ -19,17 +20,47 @@ class TestProducer(unittest.TestCase):
 
         # Verify content of queue
         items_in_queue = []
-        # We expect 3 items + 1 sentinel = 4 items
-        for _ in range(4):
+        # We expect 3 items, then the closed signal
+        for _ in range(3):
             items_in_queue.append(self.bq.get())
 
-        self.assertEqual(items_in_queue, [1, 2, 3, None])
+        self.assertEqual(items_in_queue, [1, 2, 3])
+        with self.assertRaises(QueueClosed):
+            self.bq.get()
 
     def test_empty_source(self):
         """Test producer behavior with empty source."""
-        producer = Producer(self.bq, [], delay=0.0)
+        producer = Producer(self.bq, [])
         producer.start()
         producer.join()
         
-        # Should only contain sentinel
-        self.assertIsNone(self.bq.get())
\ No newline at end of file
+        # Should only be closed
+        with self.assertRaises(QueueClosed):
+            self.bq.get()
+
+    def test_iterator_source(self):
+        """Non-sliceable sources (generators) are chunked item by item."""
+        producer = Producer(self.bq, (n for n in self.source))
+        producer.start()
+        producer.join(timeout=2.0)
+
+        self.assertEqual(self.bq.get_many(10), [1, 2, 3])
+
+    def test_deque_source(self):
+        """Sequences that cannot be sliced (deque) are chunked item by item."""
+        producer = Producer(self.bq, deque(self.source))
+        producer.start()
+        producer.join(timeout=2.0)
+
+        self.assertEqual(self.bq.get_many(10), [1, 2, 3])
+
+    def test_work_fn_hands_over_each_item(self):
+        """With per-item work, each item is enqueued before work starts on the next one."""
+        queued_before_work = []
+        producer = Producer(self.bq, self.source,
+                            work_fn=lambda item: queued_before_work.append(len(self.bq.queue)))
+        producer.start()
+        producer.join(timeout=2.0)
+
+        self.assertEqual(queued_before_work, [0, 1, 2])
+        self.assertEqual(self.bq.get_many(10), [1, 2, 3])